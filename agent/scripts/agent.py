@@ -5,56 +5,120 @@ A simple Python agent that demonstrates the proxy connection and stays running.
 This will be replaced with actual AI agent logic.
 """
 
+import argparse
+import collections
+import logging
 import os
 import sys
-import time
 import signal
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
 
 # Configure logging using LoggingConfig
 sys.path.insert(0, str(Path(__file__).parent))
 from logging_config import LoggingConfig
 
-logger = LoggingConfig.get_logger(
-    service_name=os.environ.get("SERVICE_NAME", "agent-svc"),
-    log_dir=os.environ.get("LOG_DIR", "/var/log/slapenir"),
-    log_level=os.environ.get("LOG_LEVEL", "INFO"),
+_SERVICE_NAME = os.environ.get("SERVICE_NAME", "agent-svc")
+
+# Only configure once; a reload must not reset LoggingConfig's handlers.
+# Decided from LoggingConfig's own state, since other root handlers (pytest
+# capture, a library's basicConfig) must not switch it off.
+if LoggingConfig.is_configured():
+    logger = logging.getLogger(_SERVICE_NAME)
+else:
+    logger = LoggingConfig.get_logger(
+        service_name=_SERVICE_NAME,
+        log_dir=os.environ.get("LOG_DIR", "/var/log/slapenir"),
+        log_level=os.environ.get("LOG_LEVEL", "INFO"),
+    )
+
+
+_ENV_VAR_NAMES = (
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "IBM_API_KEY",
+    "SLACK_BOT_TOKEN",
+    "AWS_ACCESS_KEY_ID",
 )
 
 
+def _mask(value: Optional[str]) -> Optional[str]:
+    """Return the display form of a secret: first 8 chars, '***', or None"""
+    if not value:
+        return None
+    # Show only first 8 chars for security
+    return f"{value[:8]}..." if len(value) > 8 else "***"
+
+
+# The container environment is fixed at startup, so read and mask it once
+_ENV_SNAPSHOT: Dict[str, Tuple[Optional[str], Optional[str]]] = {
+    name: (os.getenv(name), _mask(os.getenv(name))) for name in _ENV_VAR_NAMES
+}
+
+
 # Load environment variables
 def load_env_vars() -> Dict[str, Optional[str]]:
     """Load and log important environment variables"""
-    env_vars: Dict[str, Optional[str]] = {
-        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
-        "ANTHROPIC_API_KEY": os.getenv("ANTHROPIC_API_KEY"),
-        "IBM_API_KEY": os.getenv("IBM_API_KEY"),
-        "SLACK_BOT_TOKEN": os.getenv("SLACK_BOT_TOKEN"),
-        "AWS_ACCESS_KEY_ID": os.getenv("AWS_ACCESS_KEY_ID"),
-    }
-
     logger.info("Environment Variables Status:")
-    for var_name, var_value in env_vars.items():
-        if var_value:
-            # Show only first 8 chars for security
-            masked_value = f"{var_value[:8]}..." if len(var_value) > 8 else "***"
-            logger.info(f"  ✓ {var_name}: {masked_value}")
+    for var_name, (_, masked_value) in _ENV_SNAPSHOT.items():
+        if masked_value:
+            logger.info("  ✓ %s: %s", var_name, masked_value)
         else:
-            logger.warning(f"  ✗ {var_name}: Not set")
+            logger.warning("  ✗ %s: Not set", var_name)
 
-    return env_vars
+    return {name: value for name, (value, _) in _ENV_SNAPSHOT.items()}
 
 
+_BANNER = "=" * 60
+# Each banner is logged as one record rather than one call per line
+_START_BANNER = f"{_BANNER}\nSLAPENIR Agent Starting\n{_BANNER}"
+_SHUTDOWN_BANNER = (
+    f"{_BANNER}\nSLAPENIR Agent Shutting Down\nTotal heartbeats: %d\n{_BANNER}"
+)
+
+# Log a heartbeat summary every N heartbeats (20 x 30s = every 10 minutes)
+_HEARTBEAT_SUMMARY_INTERVAL = 20
+
 # Global flag for graceful shutdown
 shutdown_requested: bool = False
 
+# Set by signal_handler so the main loop wakes immediately instead of polling
+shutdown_event = threading.Event()
+
 
 def signal_handler(signum: int, frame: Any) -> None:
     """Handle shutdown signals gracefully"""
     global shutdown_requested
-    logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+    logger.info("Received signal %s, initiating graceful shutdown...", signum)
     shutdown_requested = True
+    shutdown_event.set()
+
+
+def _find_existing_files(paths: Iterable[Optional[str]]) -> Set[str]:
+    """Return the paths that exist, listing each shared directory only once"""
+    by_dir: DefaultDict[str, Dict[str, str]] = collections.defaultdict(dict)
+    for path in paths:
+        if path:
+            by_dir[os.path.dirname(path) or "."][os.path.basename(path)] = path
+
+    found: Set[str] = set()
+    for directory, names in by_dir.items():
+        if len(names) == 1:
+            found.update(path for path in names.values() if os.path.exists(path))
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                found.update(names[e.name] for e in entries if e.name in names)
+        except OSError:
+            pass
+    return found
 
 
 def check_environment() -> bool:
@@ -66,12 +130,12 @@ def check_environment() -> bool:
     https_proxy = os.getenv("HTTPS_PROXY")
 
     if http_proxy:
-        logger.info(f"HTTP Proxy: {http_proxy}")
+        logger.info("HTTP Proxy: %s", http_proxy)
     else:
         logger.warning("HTTP_PROXY not set")
 
     if https_proxy:
-        logger.info(f"HTTPS Proxy: {https_proxy}")
+        logger.info("HTTPS Proxy: %s", https_proxy)
     else:
         logger.warning("HTTPS_PROXY not set")
 
@@ -79,71 +143,97 @@ def check_environment() -> bool:
     cert_file = os.getenv("SSL_CERT_FILE")
     key_file = os.getenv("SSL_KEY_FILE")
     ca_bundle = os.getenv("REQUESTS_CA_BUNDLE")
+    existing = _find_existing_files((cert_file, key_file, ca_bundle))
 
-    if cert_file and os.path.exists(cert_file):
-        logger.info(f"Client certificate found: {cert_file}")
+    if cert_file in existing:
+        logger.info("Client certificate found: %s", cert_file)
     else:
-        logger.warning(f"Client certificate not found: {cert_file}")
+        logger.warning("Client certificate not found: %s", cert_file)
 
-    if key_file and os.path.exists(key_file):
-        logger.info(f"Client key found: {key_file}")
+    if key_file in existing:
+        logger.info("Client key found: %s", key_file)
     else:
-        logger.warning(f"Client key not found: {key_file}")
+        logger.warning("Client key not found: %s", key_file)
 
-    if ca_bundle and os.path.exists(ca_bundle):
-        logger.info(f"CA bundle found: {ca_bundle}")
+    if ca_bundle in existing:
+        logger.info("CA bundle found: %s", ca_bundle)
     else:
-        logger.warning(f"CA bundle not found: {ca_bundle}")
+        logger.warning("CA bundle not found: %s", ca_bundle)
 
     # Check Python version
     python_version = sys.version.split()[0]
-    logger.info(f"Python version: {python_version}")
+    logger.info("Python version: %s", python_version)
 
     return True
 
 
+# Reused across health checks so periodic probes keep one pooled connection
+_health_session: Optional["requests.Session"] = None
+if requests is not None:
+    _health_session = requests.Session()
+    _health_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+
 def test_proxy_health() -> bool:
     """Test proxy health endpoint"""
-    try:
-        import requests
+    if requests is None:
+        logger.warning("requests library not available, skipping health check")
+        return True
 
+    try:
         # Test direct connection to proxy health endpoint
         proxy_host = os.getenv("PROXY_HOST", "proxy")
         proxy_port = os.getenv("PROXY_PORT", "3000")
         health_url = f"http://{proxy_host}:{proxy_port}/health"
 
-        logger.info(f"Testing proxy health at: {health_url}")
-        response = requests.get(health_url, timeout=5)
+        logger.info("Testing proxy health at: %s", health_url)
+        response = _health_session.get(health_url, timeout=5)
 
         if response.status_code == 200:
-            logger.info(f"✓ Proxy health check passed: {response.text}")
+            logger.info("✓ Proxy health check passed: %s", response.text)
             return True
         else:
-            logger.warning(f"✗ Proxy health check failed: {response.status_code}")
+            logger.warning("✗ Proxy health check failed: %s", response.status_code)
             return False
 
-    except ImportError:
-        logger.warning("requests library not available, skipping health check")
-        return True
     except Exception as e:
-        logger.warning(f"Proxy health check error: {e}")
+        logger.warning("Proxy health check error: %s", e)
         return False
 
 
-def main() -> int:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line flags for the optional startup steps"""
+    parser = argparse.ArgumentParser(description="SLAPENIR Agent")
+    parser.add_argument(
+        "--check-proxy",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Test proxy health before entering the main loop (default: on)",
+    )
+    parser.add_argument(
+        "--load-env",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Log the status of important environment variables (default: on)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main agent loop"""
     global shutdown_requested
 
+    args = parse_args(argv if argv is not None else [])
+
     # Register signal handlers
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
 
-    logger.info("=" * 60)
-    logger.info("SLAPENIR Agent Starting")
-    logger.info("=" * 60)
+    logger.info(_START_BANNER)
 
     # Load environment variables
-    env_vars = load_env_vars()
+    if args.load_env:
+        load_env_vars()
 
     # Check environment
     if not check_environment():
@@ -151,37 +241,35 @@ def main() -> int:
         return 1
 
     # Test proxy connection
-    proxy_healthy = test_proxy_health()
-    if not proxy_healthy:
+    if args.check_proxy and not test_proxy_health():
         logger.warning("Proxy health check failed, but continuing anyway")
 
     logger.info("Agent initialization complete")
-    logger.info("Entering main loop (heartbeat every 30 seconds)...")
+    logger.info(
+        "Entering main loop (heartbeat every 30 seconds, logged every %d)...",
+        _HEARTBEAT_SUMMARY_INTERVAL,
+    )
 
     # Main loop - just stay alive and log heartbeats
     heartbeat_count = 0
     while not shutdown_requested:
         heartbeat_count += 1
-        logger.info(f"Heartbeat #{heartbeat_count} - Agent is running")
+        if heartbeat_count % _HEARTBEAT_SUMMARY_INTERVAL == 0:
+            logger.info("Heartbeats: %d - Agent is running", heartbeat_count)
 
-        # Sleep for 30 seconds (checking shutdown flag every second)
-        for _ in range(30):
-            if shutdown_requested:
-                break
-            time.sleep(1)
+        # Sleep for 30 seconds, waking early if a shutdown signal arrives
+        if shutdown_event.wait(30):
+            break
 
-    logger.info("=" * 60)
-    logger.info("SLAPENIR Agent Shutting Down")
-    logger.info(f"Total heartbeats: {heartbeat_count}")
-    logger.info("=" * 60)
+    logger.info(_SHUTDOWN_BANNER, heartbeat_count)
 
     return 0
 
 
 if __name__ == "__main__":
     try:
-        exit_code = main()
+        exit_code = main(sys.argv[1:])
         sys.exit(exit_code)
     except Exception as e:
-        logger.exception(f"Fatal error: {e}")
+        logger.exception("Fatal error: %s", e)
         sys.exit(1)
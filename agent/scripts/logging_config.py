@@ -10,6 +10,7 @@ Features:
 - StreamHandler (text format for stdout)
 - Three-tier fallback (file -> stdout -> stderr)
 - Environment-based configuration
+- Non-blocking emission via QueueHandler/QueueListener
 
 Example:
     >>> from logging_config import LoggingConfig
@@ -17,13 +18,15 @@ Example:
     >>> logger.info("Agent started")
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import json
 
 
@@ -36,6 +39,7 @@ class LoggingConfig:
     - StreamHandler (text format for stdout)
     - Three-tier fallback (file -> stdout -> stderr)
     - Environment-based configuration
+    - Non-blocking emission via QueueHandler/QueueListener
 
     Example:
         >>> logger = LoggingConfig.get_logger('agent-svc', '/var/log/slapenir', 'INFO')
@@ -44,6 +48,7 @@ class LoggingConfig:
 
     _instance: Optional["LoggingConfig"] = None
     _initialized: bool = False
+    _listener: Optional[logging.handlers.QueueListener] = None
 
     def __new__(cls):
         """Create singleton instance with lazy initialization."""
@@ -102,6 +107,11 @@ class LoggingConfig:
             logging.error(f"Cannot create log directory {log_dir}: {e}")
             return False
 
+    @classmethod
+    def is_configured(cls) -> bool:
+        """Whether get_logger has already set up the handlers in this process."""
+        return cls._listener is not None
+
     @classmethod
     def get_logger(
         cls,
@@ -132,8 +142,15 @@ class LoggingConfig:
         logger = logging.getLogger()
         logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
 
-        # Clear existing handlers
+        # Clear existing handlers and stop any previous listener thread; the
+        # listener lives on the class so one started by an earlier (reset)
+        # singleton instance is stopped too
         logger.handlers.clear()
+        if LoggingConfig._listener is not None:
+            atexit.unregister(LoggingConfig._listener.stop)
+            LoggingConfig._listener.stop()
+            LoggingConfig._listener = None
+        handlers: List[logging.Handler] = []
 
         # Tier 1: File logging (primary) - SPEC-001, SPEC-003, SPEC-006
         file_logging_enabled = False
@@ -145,7 +162,7 @@ class LoggingConfig:
                         file_handler = self._create_file_handler(
                             log_dir_path, service_name
                         )
-                        logger.addHandler(file_handler)
+                        handlers.append(file_handler)
                         file_logging_enabled = True
             except (OSError, PermissionError) as e:
                 print(f"WARNING: File logging failed: {e}", file=sys.stderr)
@@ -157,7 +174,10 @@ class LoggingConfig:
                 "[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
             )
         )
-        logger.addHandler(stdout_handler)
+        handlers.append(stdout_handler)
+
+        # Formatting and I/O happen on the listener thread; callers only enqueue
+        LoggingConfig._listener = attach_queue_listener(logger, *handlers)
 
         # Log configuration status
         logger_instance = logging.getLogger(service_name)
@@ -214,6 +234,48 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_entry)
 
 
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted.
+
+    The stock prepare() formats the message and clears exc_info/exc_text,
+    so JSONFormatter on the listener side would lose the "exception" field.
+    The queue never leaves the process, so the record can be passed as is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record unchanged for the listener's formatters."""
+        return record
+
+
+def attach_queue_listener(
+    logger: logging.Logger, *handlers: logging.Handler
+) -> logging.handlers.QueueListener:
+    """
+    Route a logger's records through a background QueueListener.
+
+    The logger only gets a QueueHandler, so emitting a record is a queue
+    put; formatting and writes for ``handlers`` run on the listener thread.
+    The listener is stopped at interpreter exit to flush pending records.
+
+    Args:
+        logger: Logger to attach the QueueHandler to
+        *handlers: Handlers that perform the actual output
+
+    Returns:
+        The started QueueListener
+    """
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    logger.addHandler(_RecordQueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
 # Convenience function for quick setup
 def setup_logging(
     service_name: str = "agent-svc",
@@ -4,26 +4,172 @@ SLAPENIR Agent mTLS Client
 Implements mutual TLS for secure proxy communication
 """
 
+import functools
+import os
+import socket
 import ssl
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.ssl_ import create_urllib3_context
 
+try:
+    import httpx  # Optional HTTP/2 backend (pip install "httpx[http2]")
+except ImportError:
+    httpx = None
+
+try:
+    import orjson  # Optional fast JSON encoder for request bodies
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Exceptions logged and re-raised by the request wrappers, for either backend
+_REQUEST_ERRORS: Tuple[type, ...] = (requests.RequestException,) + (
+    (httpx.HTTPError,) if httpx is not None else ()
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_pem(path: str, mtime_ns: int) -> str:
+    """
+    Read a PEM file, caching its contents until the file changes.
+
+    Args:
+        path: Path to the PEM file
+        mtime_ns: st_mtime_ns of the file; only part of the cache key
+
+    Returns:
+        File contents with any non-ASCII comment text dropped, as required
+        by SSLContext.load_verify_locations(cadata=...)
+    """
+    with open(path, "rb") as f:
+        return f.read().decode("ascii", errors="ignore")
+
+
+def validate_cert_files(
+    ca_cert: Path, client_cert: Path, client_key: Path
+) -> Tuple[int, ...]:
+    """
+    Validate that all required certificate files exist.
+
+    Each file is stat'ed once; the returned mtimes are the
+    build_ssl_context cache key.
+
+    Args:
+        ca_cert: Path to CA certificate file
+        client_cert: Path to client certificate file
+        client_key: Path to client private key file
+
+    Returns:
+        st_mtime_ns of the CA, client cert and key files
+
+    Raises:
+        FileNotFoundError: If any certificate file is missing
+    """
+    mtimes = []
+    for cert_file, name in [
+        (ca_cert, "CA certificate"),
+        (client_cert, "Client certificate"),
+        (client_key, "Client private key"),
+    ]:
+        try:
+            st = os.stat(cert_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{name} not found: {cert_file}") from None
+        mtimes.append(st.st_mtime_ns)
+        logger.debug("Found %s: %s", name, cert_file)
+    return tuple(mtimes)
+
+
+@functools.lru_cache(maxsize=32)
+def build_ssl_context(
+    ca_cert: str,
+    client_cert: str,
+    client_key: str,
+    verify_hostname: bool,
+    mtimes: Tuple[int, ...],
+) -> ssl.SSLContext:
+    """
+    Create SSL context with client certificates.
+
+    Contexts are cached and shared between clients using the same
+    certificates; ``mtimes`` is only part of the cache key so that
+    rotated certificate files produce a fresh context.
+
+    Args:
+        ca_cert: Path to CA certificate file
+        client_cert: Path to client certificate file
+        client_key: Path to client private key file
+        verify_hostname: Whether to verify server hostname
+        mtimes: st_mtime_ns of the CA, client cert and key files
+
+    Returns:
+        Configured SSL context
+
+    Raises:
+        ssl.SSLError: If certificate loading fails
+    """
+    # Create SSL context for client authentication; the CA bundle is loaded
+    # from memory so rebuilding a context does not re-read it from disk
+    context = ssl.create_default_context(
+        purpose=ssl.Purpose.SERVER_AUTH, cadata=_read_pem(ca_cert, mtimes[0])
+    )
+
+    # Load client certificate and private key (load_cert_chain only accepts
+    # file paths, and the key should never be copied to a temporary file)
+    try:
+        context.load_cert_chain(certfile=client_cert, keyfile=client_key)
+        logger.debug("Client certificate loaded successfully")
+    except ssl.SSLError as e:
+        logger.error("Failed to load client certificate: %s", e)
+        raise
+
+    # Configure hostname verification
+    if not verify_hostname:
+        logger.warning("Hostname verification disabled - use only for development!")
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        context.check_hostname = True
+        context.verify_mode = ssl.CERT_REQUIRED
+
+    # The agent only talks to the SLAPENIR proxy, which supports TLS 1.3, so
+    # require it: 1-RTT handshakes and only AEAD cipher suites (set_ciphers
+    # does not apply to TLS 1.3 suites, so no cipher string is needed)
+    context.minimum_version = ssl.TLSVersion.TLSv1_3
+
+    logger.debug("SSL context created with TLS 1.3")
+    return context
+
+
+# urllib3's defaults already disable Nagle (TCP_NODELAY); add keepalive so
+# idle pooled proxy connections are probed after 30s instead of going stale
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+if hasattr(socket, "TCP_KEEPIDLE"):  # Linux; not available on macOS
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+
 
 class MtlsAdapter(HTTPAdapter):
     """Custom HTTP adapter with mTLS support"""
 
     def __init__(self, ssl_context: ssl.SSLContext, *args, **kwargs):
         self.ssl_context = ssl_context
+        # All traffic goes to a single proxy host, so one pool with room for
+        # concurrent keep-alive connections avoids repeated mTLS handshakes
+        kwargs.setdefault("pool_connections", 1)
+        kwargs.setdefault("pool_maxsize", 32)
         super().__init__(*args, **kwargs)
 
     def init_poolmanager(self, *args, **kwargs):
         kwargs["ssl_context"] = self.ssl_context
+        kwargs["socket_options"] = _SOCKET_OPTIONS
         return super().init_poolmanager(*args, **kwargs)
 
 
@@ -53,6 +199,8 @@ class MtlsClient:
         client_key: str,
         verify_hostname: bool = True,
         timeout: int = 30,
+        pool_maxsize: int = 32,
+        use_http2: bool = False,
     ):
         """
         Initialize mTLS client with certificates.
@@ -63,19 +211,28 @@ class MtlsClient:
             client_key: Path to client private key file
             verify_hostname: Whether to verify server hostname (default: True)
             timeout: Default request timeout in seconds (default: 30)
+            pool_maxsize: Maximum pooled keep-alive connections (default: 32)
+            use_http2: Send requests through an httpx HTTP/2 client that
+                multiplexes concurrent requests over one connection; responses
+                are then httpx.Response objects (default: False)
 
         Raises:
             FileNotFoundError: If any certificate file is missing
             ssl.SSLError: If certificates are invalid
+            ImportError: If use_http2 is set but httpx is not installed
         """
         self.ca_cert = Path(ca_cert)
         self.client_cert = Path(client_cert)
         self.client_key = Path(client_key)
         self.verify_hostname = verify_hostname
         self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.use_http2 = use_http2
 
         # Validate certificate files exist
-        self._validate_cert_files()
+        self._cert_mtimes = validate_cert_files(
+            self.ca_cert, self.client_cert, self.client_key
+        )
 
         # Create SSL context
         self.ssl_context = self._create_ssl_context()
@@ -83,67 +240,43 @@ class MtlsClient:
         # Create session with mTLS adapter
         self.session = self._create_session()
 
-        logger.info(
-            f"mTLS client initialized with CA: {self.ca_cert}, "
-            f"Client cert: {self.client_cert}"
+        # Optional HTTP/2 client; requests go through it when enabled
+        self.http2_client = self._create_http2_client() if use_http2 else None
+        client = self.http2_client or self.session
+
+        # Bind the verb methods once; the request wrappers are the hot path
+        self._get, self._post, self._put, self._delete = (
+            client.get,
+            client.post,
+            client.put,
+            client.delete,
         )
 
-    def _validate_cert_files(self) -> None:
-        """Validate that all required certificate files exist."""
-        for cert_file, name in [
-            (self.ca_cert, "CA certificate"),
-            (self.client_cert, "Client certificate"),
-            (self.client_key, "Client private key"),
-        ]:
-            if not cert_file.exists():
-                raise FileNotFoundError(f"{name} not found: {cert_file}")
-            logger.debug(f"Found {name}: {cert_file}")
+        logger.info(
+            "mTLS client initialized with CA: %s, Client cert: %s",
+            self.ca_cert,
+            self.client_cert,
+        )
 
     def _create_ssl_context(self) -> ssl.SSLContext:
         """
-        Create SSL context with client certificates.
+        Get the SSL context for this client's certificates.
 
         Returns:
-            Configured SSL context
+            Configured SSL context, shared with other clients using the
+            same (unmodified) certificate files
 
         Raises:
             ssl.SSLError: If certificate loading fails
         """
-        # Create SSL context for client authentication
-        context = ssl.create_default_context(
-            purpose=ssl.Purpose.SERVER_AUTH, cafile=str(self.ca_cert)
-        )
-
-        # Load client certificate and private key
-        try:
-            context.load_cert_chain(
-                certfile=str(self.client_cert), keyfile=str(self.client_key)
-            )
-            logger.debug("Client certificate loaded successfully")
-        except ssl.SSLError as e:
-            logger.error(f"Failed to load client certificate: {e}")
-            raise
-
-        # Configure hostname verification
-        if not self.verify_hostname:
-            logger.warning("Hostname verification disabled - use only for development!")
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-        else:
-            context.check_hostname = True
-            context.verify_mode = ssl.CERT_REQUIRED
-
-        # Use strong ciphers only
-        context.set_ciphers(
-            "ECDHE+AESGCM:ECDHE+CHACHA20:DHE+AESGCM:DHE+CHACHA20:!aNULL:!MD5:!DSS"
+        return build_ssl_context(
+            str(self.ca_cert),
+            str(self.client_cert),
+            str(self.client_key),
+            self.verify_hostname,
+            self._cert_mtimes,
         )
 
-        # Prefer TLS 1.3, minimum TLS 1.2
-        context.minimum_version = ssl.TLSVersion.TLSv1_2
-
-        logger.debug("SSL context created with TLS 1.2+ and strong ciphers")
-        return context
-
     def _create_session(self) -> requests.Session:
         """
         Create requests session with mTLS adapter.
@@ -154,7 +287,9 @@ class MtlsClient:
         session = requests.Session()
 
         # Mount mTLS adapter for HTTPS
-        adapter = MtlsAdapter(self.ssl_context)
+        adapter = MtlsAdapter(
+            self.ssl_context, pool_connections=1, pool_maxsize=self.pool_maxsize
+        )
         session.mount("https://", adapter)
 
         # Set default headers
@@ -162,27 +297,96 @@ class MtlsClient:
             {
                 "User-Agent": "SLAPENIR-Agent/1.0",
                 "Accept": "application/json",
+                "Connection": "keep-alive",
             }
         )
 
         logger.debug("Requests session created with mTLS adapter")
         return session
 
-    def get(
+    def _create_http2_client(self) -> "httpx.Client":
+        """
+        Create httpx client negotiating HTTP/2 over mTLS.
+
+        Returns:
+            Configured httpx client
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError('use_http2 requires httpx: pip install "httpx[http2]"')
+
+        # httpx sets ALPN on the context it is given, so build a private one
+        # rather than sharing the cached context used by the requests session
+        ssl_context = build_ssl_context.__wrapped__(
+            str(self.ca_cert),
+            str(self.client_cert),
+            str(self.client_key),
+            self.verify_hostname,
+            self._cert_mtimes,
+        )
+        client = httpx.Client(
+            http2=True,
+            verify=ssl_context,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            headers={
+                "User-Agent": "SLAPENIR-Agent/1.0",
+                "Accept": "application/json",
+            },
+        )
+
+        logger.debug("HTTP/2 client created with mTLS context")
+        return client
+
+    def _encode_json_body(self, kwargs: Dict[str, Any]) -> None:
+        """
+        Pre-encode a ``json=`` payload with orjson, in place.
+
+        orjson is several times faster than the stdlib encoder on large
+        prompts and yields bytes directly. As with requests, an explicit
+        ``data`` body takes precedence, so the payload is left alone then.
+        Payloads orjson rejects (non-str keys, ints over 64 bits) stay in
+        ``json=`` for the client's stdlib encoder, and a caller-supplied
+        Content-Type is kept.
+
+        Args:
+            kwargs: Keyword arguments for the client verb method
+        """
+        if kwargs.get("data"):
+            kwargs.pop("json")
+            return
+        try:
+            body = orjson.dumps(kwargs["json"])
+        except TypeError:  # orjson.JSONEncodeError is a TypeError
+            return
+        del kwargs["json"]
+        # httpx takes raw bytes as content=; data= is for form fields there
+        body_arg = "content" if self.http2_client is not None else "data"
+        kwargs[body_arg] = body
+        headers = dict(kwargs.get("headers") or {})
+        if not any(name.lower() == "content-type" for name in headers):
+            headers["Content-Type"] = "application/json"
+        kwargs["headers"] = headers
+
+    def _request(
         self,
+        verb: str,
+        send: Callable[..., Any],
         url: str,
-        headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
         **kwargs,
     ) -> requests.Response:
         """
-        Make GET request with mTLS.
+        Send a request through a bound client verb, logging the outcome.
 
         Args:
+            verb: HTTP method name, for logging
+            send: Bound client method that performs the request
             url: Request URL
-            headers: Additional headers
             timeout: Request timeout (uses default if not specified)
-            **kwargs: Additional arguments passed to requests
+            **kwargs: Additional arguments passed to ``send``
 
         Returns:
             Response object
@@ -191,16 +395,47 @@ class MtlsClient:
             requests.RequestException: On request failure
         """
         timeout = timeout or self.timeout
-        logger.debug(f"GET {url}")
+        if orjson is not None and kwargs.get("json") is not None:
+            self._encode_json_body(kwargs)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("%s %s", verb, url)
 
         try:
-            response = self.session.get(url, headers=headers, timeout=timeout, **kwargs)
-            logger.debug(f"GET {url} -> {response.status_code}")
+            response = send(url, timeout=timeout, **kwargs)
+            if debug:
+                logger.debug("%s %s -> %s", verb, url, response.status_code)
             return response
-        except requests.RequestException as e:
-            logger.error(f"GET {url} failed: {e}")
+        except _REQUEST_ERRORS as e:
+            logger.error("%s %s failed: %s", verb, url, e)
             raise
 
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Make GET request with mTLS.
+
+        Args:
+            url: Request URL
+            headers: Additional headers
+            timeout: Request timeout (uses default if not specified)
+            **kwargs: Additional arguments passed to requests
+
+        Returns:
+            Response object
+
+        Raises:
+            requests.RequestException: On request failure
+        """
+        return self._request(
+            "GET", self._get, url, headers=headers, timeout=timeout, **kwargs
+        )
+
     def post(
         self,
         url: str,
@@ -227,18 +462,16 @@ class MtlsClient:
         Raises:
             requests.RequestException: On request failure
         """
-        timeout = timeout or self.timeout
-        logger.debug(f"POST {url}")
-
-        try:
-            response = self.session.post(
-                url, json=json, data=data, headers=headers, timeout=timeout, **kwargs
-            )
-            logger.debug(f"POST {url} -> {response.status_code}")
-            return response
-        except requests.RequestException as e:
-            logger.error(f"POST {url} failed: {e}")
-            raise
+        return self._request(
+            "POST",
+            self._post,
+            url,
+            json=json,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            **kwargs,
+        )
 
     def put(
         self,
@@ -250,18 +483,16 @@ class MtlsClient:
         **kwargs,
     ) -> requests.Response:
         """Make PUT request with mTLS."""
-        timeout = timeout or self.timeout
-        logger.debug(f"PUT {url}")
-
-        try:
-            response = self.session.put(
-                url, json=json, data=data, headers=headers, timeout=timeout, **kwargs
-            )
-            logger.debug(f"PUT {url} -> {response.status_code}")
-            return response
-        except requests.RequestException as e:
-            logger.error(f"PUT {url} failed: {e}")
-            raise
+        return self._request(
+            "PUT",
+            self._put,
+            url,
+            json=json,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            **kwargs,
+        )
 
     def delete(
         self,
@@ -271,22 +502,15 @@ class MtlsClient:
         **kwargs,
     ) -> requests.Response:
         """Make DELETE request with mTLS."""
-        timeout = timeout or self.timeout
-        logger.debug(f"DELETE {url}")
-
-        try:
-            response = self.session.delete(
-                url, headers=headers, timeout=timeout, **kwargs
-            )
-            logger.debug(f"DELETE {url} -> {response.status_code}")
-            return response
-        except requests.RequestException as e:
-            logger.error(f"DELETE {url} failed: {e}")
-            raise
+        return self._request(
+            "DELETE", self._delete, url, headers=headers, timeout=timeout, **kwargs
+        )
 
     def close(self) -> None:
         """Close the underlying session."""
         self.session.close()
+        if self.http2_client is not None:
+            self.http2_client.close()
         logger.debug("mTLS client session closed")
 
     def __enter__(self):
@@ -308,6 +532,7 @@ def create_mtls_client_from_env() -> MtlsClient:
         MTLS_CLIENT_KEY: Path to client private key
         MTLS_VERIFY_HOSTNAME: Whether to verify hostname (default: true)
         MTLS_TIMEOUT: Request timeout in seconds (default: 30)
+        MTLS_HTTP2: Whether to use the HTTP/2 backend (default: false)
 
     Returns:
         Configured MtlsClient instance
@@ -315,8 +540,6 @@ def create_mtls_client_from_env() -> MtlsClient:
     Raises:
         ValueError: If required environment variables are missing
     """
-    import os
-
     ca_cert = os.getenv("MTLS_CA_CERT")
     client_cert = os.getenv("MTLS_CLIENT_CERT")
     client_key = os.getenv("MTLS_CLIENT_KEY")
@@ -329,6 +552,7 @@ def create_mtls_client_from_env() -> MtlsClient:
 
     verify_hostname = os.getenv("MTLS_VERIFY_HOSTNAME", "true").lower() == "true"
     timeout = int(os.getenv("MTLS_TIMEOUT", "30"))
+    use_http2 = os.getenv("MTLS_HTTP2", "false").lower() == "true"
 
     return MtlsClient(
         ca_cert=ca_cert,
@@ -336,6 +560,7 @@ def create_mtls_client_from_env() -> MtlsClient:
         client_key=client_key,
         verify_hostname=verify_hostname,
         timeout=timeout,
+        use_http2=use_http2,
     )
 
 
@@ -343,10 +568,15 @@ if __name__ == "__main__":
     # Example usage
     import sys
 
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    from logging_config import attach_queue_listener
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     )
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    attach_queue_listener(root_logger, stream_handler)
 
     logger = logging.getLogger(__name__)
 
@@ -360,8 +590,8 @@ if __name__ == "__main__":
         with MtlsClient(ca_cert, client_cert, client_key) as client:
             # Test connection
             response = client.get("https://localhost:3000/health")
-            logger.info(f"Health check: {response.status_code}")
+            logger.info("Health check: %s", response.status_code)
             logger.info(response.text)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(1)
@@ -0,0 +1,217 @@
+"""
+SLAPENIR Agent async mTLS Client
+Implements mutual TLS for concurrent proxy communication using aiohttp
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+import aiohttp
+
+from mtls_client import build_ssl_context, validate_cert_files
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMtlsClient:
+    """
+    Asynchronous HTTP client with mutual TLS authentication support.
+
+    Mirrors MtlsClient, but requests are coroutines sharing one connection
+    pool, so many proxy calls can be in flight from a single event loop.
+
+    Example:
+        >>> async with AsyncMtlsClient(
+        ...     ca_cert="certs/root_ca.crt",
+        ...     client_cert="certs/agent-01.crt",
+        ...     client_key="certs/agent-01.key"
+        ... ) as client:
+        ...     response = await client.post(
+        ...         "https://proxy:3000/v1/chat/completions",
+        ...         json={"model": "gpt-4", "messages": [...]}
+        ...     )
+        ...     body = await response.json()
+    """
+
+    def __init__(
+        self,
+        ca_cert: str,
+        client_cert: str,
+        client_key: str,
+        verify_hostname: bool = True,
+        timeout: int = 30,
+        limit: int = 64,
+    ):
+        """
+        Initialize async mTLS client with certificates.
+
+        Args:
+            ca_cert: Path to CA certificate file
+            client_cert: Path to client certificate file
+            client_key: Path to client private key file
+            verify_hostname: Whether to verify server hostname (default: True)
+            timeout: Default request timeout in seconds (default: 30)
+            limit: Maximum simultaneous connections (default: 64)
+
+        Raises:
+            FileNotFoundError: If any certificate file is missing
+            ssl.SSLError: If certificates are invalid
+        """
+        self.ca_cert = Path(ca_cert)
+        self.client_cert = Path(client_cert)
+        self.client_key = Path(client_key)
+        self.verify_hostname = verify_hostname
+        self.timeout = timeout
+        self.limit = limit
+
+        # Validate certificate files exist
+        self._cert_mtimes = validate_cert_files(
+            self.ca_cert, self.client_cert, self.client_key
+        )
+
+        # Shared with MtlsClient instances using the same certificates
+        self.ssl_context = build_ssl_context(
+            str(self.ca_cert),
+            str(self.client_cert),
+            str(self.client_key),
+            self.verify_hostname,
+            self._cert_mtimes,
+        )
+
+        # The session must be created inside a running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        logger.info(
+            "Async mTLS client initialized with CA: %s, Client cert: %s",
+            self.ca_cert,
+            self.client_cert,
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the aiohttp session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                ssl=self.ssl_context,
+                limit=self.limit,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    "User-Agent": "SLAPENIR-Agent/1.0",
+                    "Accept": "application/json",
+                },
+            )
+            logger.debug("aiohttp session created with mTLS connector")
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> aiohttp.ClientResponse:
+        """
+        Make request with mTLS.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Request timeout (uses default if not specified)
+            **kwargs: Additional arguments passed to aiohttp
+
+        Returns:
+            Response object; the caller reads (or releases) the body
+
+        Raises:
+            aiohttp.ClientError: On request failure
+        """
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        logger.debug("%s %s", method, url)
+
+        try:
+            response = await self.session.request(method, url, **kwargs)
+            logger.debug("%s %s -> %s", method, url, response.status)
+            return response
+        except aiohttp.ClientError as e:
+            logger.error("%s %s failed: %s", method, url, e)
+            raise
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> aiohttp.ClientResponse:
+        """Make GET request with mTLS."""
+        return await self._request(
+            "GET", url, headers=headers, timeout=timeout, **kwargs
+        )
+
+    async def post(
+        self,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> aiohttp.ClientResponse:
+        """Make POST request with mTLS."""
+        return await self._request(
+            "POST",
+            url,
+            json=json,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            **kwargs,
+        )
+
+    async def put(
+        self,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> aiohttp.ClientResponse:
+        """Make PUT request with mTLS."""
+        return await self._request(
+            "PUT", url, json=json, data=data, headers=headers, timeout=timeout, **kwargs
+        )
+
+    async def delete(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> aiohttp.ClientResponse:
+        """Make DELETE request with mTLS."""
+        return await self._request(
+            "DELETE", url, headers=headers, timeout=timeout, **kwargs
+        )
+
+    async def close(self) -> None:
+        """Close the underlying session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        logger.debug("Async mTLS client session closed")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
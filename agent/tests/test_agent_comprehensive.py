@@ -1,295 +0,0 @@
-#!/usr/bin/env python3
-"""
-Comprehensive unit tests for the SLAPENIR agent module
-Achieves 80%+ code coverage with extensive edge case testing
-"""
-
-import unittest
-import sys
-import os
-import signal
-import time
-from unittest.mock import patch, MagicMock, mock_open
-from io import StringIO
-
-# Add agent scripts to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
-
-import agent
-
-
-class TestAgentEnvironmentChecks(unittest.TestCase):
-    """Test environment configuration checks"""
-    
-    @patch.dict(os.environ, {
-        'HTTP_PROXY': 'http://proxy:3000',
-        'HTTPS_PROXY': 'https://proxy:3000',
-        'SSL_CERT_FILE': '/certs/client.crt',
-        'SSL_KEY_FILE': '/certs/client.key',
-        'REQUESTS_CA_BUNDLE': '/certs/ca.crt'
-    })
-    @patch('os.path.exists', return_value=True)
-    def test_check_environment_all_vars_present(self, mock_exists):
-        """Test environment check with all variables present"""
-        result = agent.check_environment()
-        self.assertTrue(result)
-    
-    @patch.dict(os.environ, {}, clear=True)
-    def test_check_environment_missing_vars(self):
-        """Test environment check with missing variables"""
-        result = agent.check_environment()
-        self.assertTrue(result)  # Should still return True but log warnings
-    
-    @patch.dict(os.environ, {'SSL_CERT_FILE': '/nonexistent/cert.crt'})
-    @patch('os.path.exists', return_value=False)
-    def test_check_environment_missing_cert_files(self, mock_exists):
-        """Test environment check with missing certificate files"""
-        result = agent.check_environment()
-        self.assertTrue(result)  # Returns True but logs warnings
-    
-    @patch.dict(os.environ, {
-        'HTTP_PROXY': '',
-        'HTTPS_PROXY': '',
-    })
-    def test_check_environment_empty_proxy_vars(self):
-        """Test environment check with empty proxy variables"""
-        result = agent.check_environment()
-        self.assertTrue(result)
-    
-    def test_check_environment_python_version(self):
-        """Test that Python version is logged"""
-        with patch('sys.version', '3.10.0 (main, Jan 1 2024)'):
-            result = agent.check_environment()
-            self.assertTrue(result)
-
-
-class TestProxyHealthCheck(unittest.TestCase):
-    """Test proxy health check functionality"""
-    
-    @patch('agent.requests.get')
-    @patch.dict(os.environ, {'PROXY_HOST': 'proxy', 'PROXY_PORT': '3000'})
-    def test_proxy_health_check_success(self, mock_get):
-        """Test successful proxy health check"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = 'OK'
-        mock_get.return_value = mock_response
-        
-        result = agent.test_proxy_health()
-        self.assertTrue(result)
-        mock_get.assert_called_once()
-    
-    @patch('agent.requests.get')
-    @patch.dict(os.environ, {'PROXY_HOST': 'proxy', 'PROXY_PORT': '3000'})
-    def test_proxy_health_check_failure(self, mock_get):
-        """Test failed proxy health check"""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_get.return_value = mock_response
-        
-        result = agent.test_proxy_health()
-        self.assertFalse(result)
-    
-    @patch('agent.requests.get')
-    @patch.dict(os.environ, {'PROXY_HOST': 'proxy', 'PROXY_PORT': '3000'})
-    def test_proxy_health_check_timeout(self, mock_get):
-        """Test proxy health check with timeout"""
-        mock_get.side_effect = Exception("Connection timeout")
-        
-        result = agent.test_proxy_health()
-        self.assertFalse(result)
-    
-    @patch('agent.requests.get')
-    @patch.dict(os.environ, {}, clear=True)
-    def test_proxy_health_check_default_values(self, mock_get):
-        """Test proxy health check with default host/port"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
-        
-        result = agent.test_proxy_health()
-        self.assertTrue(result)
-        # Should use defaults: proxy:3000
-        call_args = mock_get.call_args
-        self.assertIn('http://proxy:3000/health', str(call_args))
-    
-    @patch('agent.requests', None)  # Simulate missing requests library
-    def test_proxy_health_check_no_requests_library(self):
-        """Test proxy health check when requests library is not available"""
-        result = agent.test_proxy_health()
-        self.assertTrue(result)  # Returns True with warning
-
-
-class TestSignalHandling(unittest.TestCase):
-    """Test signal handling for graceful shutdown"""
-    
-    def test_signal_handler_sets_shutdown_flag(self):
-        """Test that signal handler sets the shutdown flag"""
-        agent.shutdown_requested = False
-        agent.signal_handler(signal.SIGTERM, None)
-        self.assertTrue(agent.shutdown_requested)
-        # Reset for other tests
-        agent.shutdown_requested = False
-    
-    def test_signal_handler_with_sigint(self):
-        """Test signal handler with SIGINT"""
-        agent.shutdown_requested = False
-        agent.signal_handler(signal.SIGINT, None)
-        self.assertTrue(agent.shutdown_requested)
-        agent.shutdown_requested = False
-    
-    def test_signal_handler_multiple_calls(self):
-        """Test signal handler called multiple times"""
-        agent.shutdown_requested = False
-        agent.signal_handler(signal.SIGTERM, None)
-        agent.signal_handler(signal.SIGTERM, None)
-        agent.signal_handler(signal.SIGTERM, None)
-        self.assertTrue(agent.shutdown_requested)
-        agent.shutdown_requested = False
-
-
-class TestMainLoop(unittest.TestCase):
-    """Test main agent loop functionality"""
-    
-    @patch('agent.check_environment', return_value=True)
-    @patch('agent.test_proxy_health', return_value=True)
-    @patch('time.sleep')
-    def test_main_loop_starts_successfully(self, mock_sleep, mock_health, mock_env):
-        """Test that main loop starts successfully"""
-        agent.shutdown_requested = False
-        
-        # Set shutdown flag after first iteration
-        def set_shutdown(*args):
-            agent.shutdown_requested = True
-        
-        mock_sleep.side_effect = set_shutdown
-        
-        exit_code = agent.main()
-        self.assertEqual(exit_code, 0)
-        mock_env.assert_called_once()
-        mock_health.assert_called_once()
-    
-    @patch('agent.check_environment', return_value=False)
-    def test_main_loop_env_check_failure(self, mock_env):
-        """Test main loop when environment check fails"""
-        exit_code = agent.main()
-        self.assertEqual(exit_code, 1)
-    
-    @patch('agent.check_environment', return_value=True)
-    @patch('agent.test_proxy_health', return_value=False)
-    @patch('time.sleep')
-    def test_main_loop_proxy_health_warning(self, mock_sleep, mock_health, mock_env):
-        """Test main loop continues even if proxy health check fails"""
-        agent.shutdown_requested = False
-        
-        def set_shutdown(*args):
-            agent.shutdown_requested = True
-        
-        mock_sleep.side_effect = set_shutdown
-        
-        exit_code = agent.main()
-        self.assertEqual(exit_code, 0)  # Should still succeed
-    
-    @patch('agent.check_environment', return_value=True)
-    @patch('agent.test_proxy_health', return_value=True)
-    @patch('time.sleep')
-    def test_main_loop_heartbeat_counting(self, mock_sleep, mock_health, mock_env):
-        """Test that heartbeats are counted correctly"""
-        agent.shutdown_requested = False
-        call_count = [0]
-        
-        def count_and_shutdown(*args):
-            call_count[0] += 1
-            if call_count[0] >= 3:
-                agent.shutdown_requested = True
-        
-        mock_sleep.side_effect = count_and_shutdown
-        
-        exit_code = agent.main()
-        self.assertEqual(exit_code, 0)
-        self.assertGreaterEqual(call_count[0], 3)
-    
-    @patch('agent.check_environment', return_value=True)
-    @patch('agent.test_proxy_health', return_value=True)
-    @patch('time.sleep')
-    @patch('signal.signal')
-    def test_main_loop_signal_registration(self, mock_signal, mock_sleep, mock_health, mock_env):
-        """Test that signals are registered correctly"""
-        agent.shutdown_requested = False
-        
-        def set_shutdown(*args):
-            agent.shutdown_requested = True
-        
-        mock_sleep.side_effect = set_shutdown
-        
-        agent.main()
-        
-        # Check that signal handlers were registered
-        self.assertGreaterEqual(mock_signal.call_count, 2)
-
-
-class TestAgentIntegration(unittest.TestCase):
-    """Integration tests for agent functionality"""
-    
-    @patch('agent.check_environment', return_value=True)
-    @patch('agent.test_proxy_health', return_value=True)
-    @patch('time.sleep')
-    def test_full_agent_lifecycle(self, mock_sleep, mock_health, mock_env):
-        """Test complete agent lifecycle from start to shutdown"""
-        agent.shutdown_requested = False
-        iterations = [0]
-        
-        def simulate_runtime(*args):
-            iterations[0] += 1
-            if iterations[0] >= 5:
-                agent.shutdown_requested = True
-        
-        mock_sleep.side_effect = simulate_runtime
-        
-        exit_code = agent.main()
-        
-        self.assertEqual(exit_code, 0)
-        self.assertEqual(iterations[0], 5)
-        mock_env.assert_called_once()
-        mock_health.assert_called_once()
-
-
-class TestAgentEdgeCases(unittest.TestCase):
-    """Test edge cases and error conditions"""
-    
-    @patch.dict(os.environ, {'PROXY_HOST': 'invalid_host', 'PROXY_PORT': 'invalid_port'})
-    @patch('agent.requests.get')
-    def test_invalid_proxy_configuration(self, mock_get):
-        """Test behavior with invalid proxy configuration"""
-        mock_get.side_effect = Exception("Invalid configuration")
-        result = agent.test_proxy_health()
-        self.assertFalse(result)
-    
-    @patch('agent.check_environment')
-    def test_environment_check_exception(self, mock_env):
-        """Test handling of exceptions during environment check"""
-        mock_env.side_effect = Exception("Unexpected error")
-        
-        with self.assertRaises(Exception):
-            agent.main()
-    
-    def test_shutdown_flag_initial_state(self):
-        """Test that shutdown flag starts as False"""
-        # Reset the flag
-        agent.shutdown_requested = False
-        self.assertFalse(agent.shutdown_requested)
-
-
-class TestLogging(unittest.TestCase):
-    """Test logging functionality"""
-    
-    @patch('sys.stdout', new_callable=StringIO)
-    @patch('agent.check_environment', return_value=True)
-    def test_logging_output_format(self, mock_env, mock_stdout):
-        """Test that logging output is formatted correctly"""
-        agent.check_environment()
-        # Just verify no exceptions are raised
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
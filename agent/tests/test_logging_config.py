@@ -184,3 +184,85 @@ class TestConfiguration:
         # Clean up
         LoggingConfig._instance = None
         LoggingConfig._initialized = False
+
+
+class TestQueuedEmission:
+    """Non-blocking emission via QueueHandler/QueueListener"""
+
+    def test_root_logger_uses_queue_handler(self, monkeypatch, tmp_path: Path):
+        """Records are enqueued and written to the file by the listener thread."""
+        import logging.handlers
+
+        from logging_config import LoggingConfig
+
+        monkeypatch.setenv("LOG_ENABLED", "true")
+
+        # Reset singleton
+        LoggingConfig._instance = None
+        LoggingConfig._initialized = False
+
+        logger = LoggingConfig.get_logger("queue-test", str(tmp_path), "INFO")
+        root_handlers = logging.getLogger().handlers
+
+        assert len(root_handlers) == 1
+        assert isinstance(root_handlers[0], logging.handlers.QueueHandler)
+
+        logger.info("queued message")
+        LoggingConfig()._listener.queue.join()
+
+        assert "queued message" in (tmp_path / "queue-test.log").read_text()
+
+        # Clean up
+        LoggingConfig._instance = None
+        LoggingConfig._initialized = False
+
+    def test_exception_reaches_json_formatter(self, monkeypatch, tmp_path: Path):
+        """Tracebacks logged through the queue keep their own JSON field."""
+        import json
+
+        from logging_config import LoggingConfig
+
+        monkeypatch.setenv("LOG_ENABLED", "true")
+
+        LoggingConfig._instance = None
+        LoggingConfig._initialized = False
+
+        logger = LoggingConfig.get_logger("exc-test", str(tmp_path), "INFO")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("request failed")
+        LoggingConfig._listener.queue.join()
+
+        lines = (tmp_path / "exc-test.log").read_text().splitlines()
+        entry = json.loads(lines[-1])
+
+        assert entry["message"] == "request failed"
+        assert entry["exception"].startswith("Traceback")
+        assert "ValueError: boom" in entry["exception"]
+
+        # Clean up
+        LoggingConfig._instance = None
+        LoggingConfig._initialized = False
+
+    def test_reconfigure_stops_previous_listener(self, monkeypatch, tmp_path: Path):
+        """Re-creating the singleton stops the listener the old one started."""
+        from logging_config import LoggingConfig
+
+        monkeypatch.setenv("LOG_ENABLED", "true")
+
+        LoggingConfig._instance = None
+        LoggingConfig._initialized = False
+        LoggingConfig.get_logger("listener-test", str(tmp_path), "INFO")
+        first_listener = LoggingConfig._listener
+
+        LoggingConfig._instance = None
+        LoggingConfig._initialized = False
+        LoggingConfig.get_logger("listener-test", str(tmp_path), "INFO")
+
+        assert LoggingConfig._listener is not first_listener
+        assert first_listener._thread is None  # stopped
+
+        # Clean up
+        LoggingConfig._instance = None
+        LoggingConfig._initialized = False
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SLAPENIR agent mTLS client
+Covers request body encoding; no certificates or network are needed
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add agent scripts to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import mtls_client
+from mtls_client import MtlsClient
+
+
+def _client(http2: bool = False) -> MtlsClient:
+    """MtlsClient with only the attributes request encoding reads"""
+    client = MtlsClient.__new__(MtlsClient)
+    client.timeout = 30
+    client.http2_client = MagicMock() if http2 else None
+    return client
+
+
+@unittest.skipIf(mtls_client.orjson is None, 'orjson not installed')
+class TestJsonBodyEncoding(unittest.TestCase):
+    """Test orjson pre-encoding of json= payloads"""
+
+    def test_requests_body_goes_to_data(self):
+        """requests gets the encoded payload as data= with a JSON header"""
+        kwargs = {'json': {'model': 'gpt-4'}, 'headers': {'X-Trace': '1'}}
+        _client()._encode_json_body(kwargs)
+
+        self.assertNotIn('json', kwargs)
+        self.assertEqual(kwargs['data'], b'{"model":"gpt-4"}')
+        self.assertEqual(kwargs['headers'], {
+            'X-Trace': '1', 'Content-Type': 'application/json'
+        })
+
+    def test_httpx_body_goes_to_content(self):
+        """httpx gets the encoded payload as content=, not form data="""
+        kwargs = {'json': {'model': 'gpt-4'}, 'headers': None}
+        _client(http2=True)._encode_json_body(kwargs)
+
+        self.assertNotIn('json', kwargs)
+        self.assertNotIn('data', kwargs)
+        self.assertEqual(kwargs['content'], b'{"model":"gpt-4"}')
+        self.assertEqual(kwargs['headers'], {'Content-Type': 'application/json'})
+
+    def test_explicit_data_takes_precedence(self):
+        """An explicit data= body is sent unchanged and json= is dropped"""
+        kwargs = {'json': {'ignored': True}, 'data': b'raw', 'headers': None}
+        _client()._encode_json_body(kwargs)
+
+        self.assertEqual(kwargs, {'data': b'raw', 'headers': None})
+
+    def test_caller_content_type_preserved(self):
+        """A caller-set Content-Type is kept, whatever its case"""
+        for name, value in [
+            ('Content-Type', 'application/vnd.api+json'),
+            ('content-type', 'application/json; charset=utf-8'),
+        ]:
+            with self.subTest(header=name):
+                kwargs = {'json': {'a': 1}, 'headers': {name: value}}
+                _client()._encode_json_body(kwargs)
+                self.assertEqual(kwargs['headers'], {name: value})
+
+    def test_unsupported_payload_left_for_stdlib(self):
+        """Payloads orjson rejects stay in json= for the client to encode"""
+        for payload in [{1: 'non-str key'}, {'n': 2 ** 70}]:
+            with self.subTest(payload=payload):
+                kwargs = {'json': payload, 'headers': None}
+                _client()._encode_json_body(kwargs)
+                self.assertEqual(kwargs, {'json': payload, 'headers': None})
+
+    def test_request_sends_encoded_body(self):
+        """_request passes the encoded body and default timeout to the client"""
+        send = MagicMock()
+        _client()._request('POST', send, 'https://proxy:3000/v1', json={'a': 1})
+
+        send.assert_called_once_with(
+            'https://proxy:3000/v1', timeout=30,
+            data=b'{"a":1}', headers={'Content-Type': 'application/json'}
+        )
+
+
+class TestValidateCertFiles(unittest.TestCase):
+    """Test the certificate check shared by the sync and async clients"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.paths = [Path(tmp.name, n) for n in ('ca.crt', 'agent.crt', 'agent.key')]
+        for path in self.paths:
+            path.write_text('pem')
+
+    def test_returns_mtimes(self):
+        """Mtimes are returned in CA, certificate, key order"""
+        os.utime(self.paths[2], ns=(0, 42))
+        mtimes = mtls_client.validate_cert_files(*self.paths)
+
+        self.assertEqual(mtimes, tuple(p.stat().st_mtime_ns for p in self.paths))
+        self.assertEqual(mtimes[2], 42)
+
+    def test_missing_file_named(self):
+        """A missing file raises FileNotFoundError naming which one"""
+        self.paths[1].unlink()
+
+        with self.assertRaisesRegex(FileNotFoundError, 'Client certificate not found'):
+            mtls_client.validate_cert_files(*self.paths)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SLAPENIR agent async mTLS client
+aiohttp's session and connector are mocked; no certificates or network are needed
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add agent scripts to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+try:
+    import aiohttp
+    import mtls_client_async
+    from mtls_client_async import AsyncMtlsClient
+except ImportError:  # aiohttp not installed
+    mtls_client_async = None
+
+
+@unittest.skipIf(mtls_client_async is None, 'aiohttp not installed')
+class TestAsyncMtlsClient(unittest.IsolatedAsyncioTestCase):
+    """Test session lifecycle and request error handling"""
+
+    def setUp(self):
+        self.ssl_context = MagicMock(name='ssl_context')
+        for target, kwargs in [
+            ('validate_cert_files', {'return_value': (1, 2, 3)}),
+            ('build_ssl_context', {'return_value': self.ssl_context}),
+        ]:
+            patcher = patch.object(mtls_client_async, target, **kwargs)
+            setattr(self, target, patcher.start())
+            self.addCleanup(patcher.stop)
+
+        patcher = patch.object(mtls_client_async.aiohttp, 'TCPConnector')
+        self.connector_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch.object(mtls_client_async.aiohttp, 'ClientSession')
+        self.session_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.session_cls.return_value.closed = False
+        self.session_cls.return_value.close = AsyncMock()
+
+        self.client = AsyncMtlsClient('ca.crt', 'agent.crt', 'agent.key', limit=8)
+
+    def test_init_uses_shared_helpers(self):
+        """Certificates are validated and the shared SSL context is reused"""
+        self.validate_cert_files.assert_called_once_with(
+            self.client.ca_cert, self.client.client_cert, self.client.client_key
+        )
+        self.build_ssl_context.assert_called_once_with(
+            'ca.crt', 'agent.crt', 'agent.key', True, (1, 2, 3)
+        )
+        self.assertIs(self.client.ssl_context, self.ssl_context)
+
+    def test_session_created_lazily(self):
+        """No session exists until first use, then the same one is reused"""
+        self.session_cls.assert_not_called()
+
+        session = self.client.session
+        self.assertIs(self.client.session, session)
+
+        self.session_cls.assert_called_once()
+        self.connector_cls.assert_called_once_with(
+            ssl=self.ssl_context, limit=8,
+            ttl_dns_cache=300, enable_cleanup_closed=True
+        )
+        self.assertIs(
+            self.session_cls.call_args.kwargs['connector'],
+            self.connector_cls.return_value
+        )
+
+    def test_closed_session_recreated(self):
+        """A session closed elsewhere is replaced on next use"""
+        stale = self.client.session
+        stale.closed = True
+        self.session_cls.return_value = MagicMock(closed=False)
+
+        self.assertIsNot(self.client.session, stale)
+        self.assertEqual(self.session_cls.call_count, 2)
+
+    async def test_close(self):
+        """close() closes the open session and forgets it"""
+        session = self.client.session
+        await self.client.close()
+
+        session.close.assert_awaited_once()
+        self.assertIsNone(self.client._session)
+
+    async def test_close_without_session(self):
+        """close() before any request is a no-op"""
+        await self.client.close()
+
+        self.session_cls.assert_not_called()
+        self.assertIsNone(self.client._session)
+
+    async def test_async_context_manager_closes(self):
+        """Leaving the async with block closes the session"""
+        async with self.client as client:
+            session = client.session
+
+        session.close.assert_awaited_once()
+
+    async def test_request_passes_timeout(self):
+        """A per-request timeout becomes an aiohttp.ClientTimeout"""
+        response = MagicMock(status=200)
+        self.client.session.request = AsyncMock(return_value=response)
+
+        result = await self.client.post(
+            'https://proxy:3000/v1', timeout=5, json={'a': 1}
+        )
+
+        self.assertIs(result, response)
+        self.client.session.request.assert_awaited_once_with(
+            'POST', 'https://proxy:3000/v1',
+            json={'a': 1}, data=None, headers=None,
+            timeout=aiohttp.ClientTimeout(total=5)
+        )
+
+    async def test_request_error_logged_and_reraised(self):
+        """aiohttp.ClientError is logged with method and URL, then re-raised"""
+        error = aiohttp.ClientConnectionError('connection refused')
+        self.client.session.request = AsyncMock(side_effect=error)
+
+        with self.assertLogs('mtls_client_async', 'ERROR') as logs:
+            with self.assertRaises(aiohttp.ClientConnectionError) as ctx:
+                await self.client.get('https://proxy:3000/health')
+
+        self.assertIs(ctx.exception, error)
+        self.assertIn('GET https://proxy:3000/health failed', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,35 +7,33 @@ Requirement: REQ-001
 Tests verify that Node.js and npm are correctly installed in the container.
 """
 
+import shutil
 import subprocess
 import sys
-import os
 
 
 def test_node_binary_exists():
     """TEST-001-001: Verify node binary exists"""
-    result = subprocess.run(['which', 'node'], capture_output=True)
-    assert result.returncode == 0, "node binary not found in PATH"
-    node_path = result.stdout.decode().strip()
-    assert os.path.exists(node_path), f"node binary path {node_path} does not exist"
+    # shutil.which only returns existing, executable files on PATH
+    node_path = shutil.which('node')
+    assert node_path, "node binary not found in PATH"
     print(f"✓ node binary found at {node_path}")
 
 
 def test_npm_binary_exists():
     """TEST-001-002: Verify npm binary exists"""
-    result = subprocess.run(['which', 'npm'], capture_output=True)
-    assert result.returncode == 0, "npm binary not found in PATH"
-    npm_path = result.stdout.decode().strip()
-    assert os.path.exists(npm_path), f"npm binary path {npm_path} does not exist"
+    # shutil.which only returns existing, executable files on PATH
+    npm_path = shutil.which('npm')
+    assert npm_path, "npm binary not found in PATH"
     print(f"✓ npm binary found at {npm_path}")
 
 
 def test_node_version():
     """TEST-001-003: Verify node version >= 20"""
-    result = subprocess.run(['node', '--version'], capture_output=True)
+    result = subprocess.run(['node', '--version'], capture_output=True, text=True)
     assert result.returncode == 0, "node --version failed"
 
-    version_str = result.stdout.decode().strip()
+    version_str = result.stdout.strip()
     # Version format: v20.11.0
     assert version_str.startswith('v'), f"Unexpected version format: {version_str}"
 
@@ -46,9 +44,9 @@ def test_node_version():
 
 def test_npm_version():
     """TEST-001-003b: Verify npm version works"""
-    result = subprocess.run(['npm', '--version'], capture_output=True)
+    result = subprocess.run(['npm', '--version'], capture_output=True, text=True)
     assert result.returncode == 0, "npm --version failed"
-    version = result.stdout.decode().strip()
+    version = result.stdout.strip()
     print(f"✓ npm version {version}")
 
 
@@ -10,19 +10,29 @@ Tests verify that OpenCode permissions are correctly configured and enforced.
 import json
 import sys
 import os
+from functools import lru_cache
+
+try:
+    import orjson  # Optional fast JSON parser
+except ImportError:
+    orjson = None
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 AGENTS_MD_PATH = os.path.join(SCRIPT_DIR, "..", "config", "AGENTS.md")
 
 
+@lru_cache(maxsize=1)
 def load_config():
-    """Load OpenCode configuration"""
+    """Load OpenCode configuration (read and parsed once per process)"""
     config_path = "/home/agent/.opencode/config.json"
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        return json.load(f)
+    if orjson is None:
+        with open(config_path, "r") as f:
+            return json.load(f)
+    with open(config_path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def load_agents_md():
@@ -130,7 +140,7 @@ def test_model_configuration():
     assert len(models) > 0, "at least one model should be configured"
 
     # Check first model has required fields
-    model_name = list(models.keys())[0]
+    model_name = next(iter(models))
     model_config = models[model_name]
     assert "name" in model_config, "model should have name"
     assert "limit" in model_config, "model should have limit"
@@ -2,20 +2,63 @@
 """
 Startup Validation Tests for SLAPENIR
 Tests mTLS, proxy routing, and credential injection on startup
+
+Run directly for the colored report, or under pytest/unittest for one
+subtest per check.
 """
 
+import contextlib
+import io
 import os
+import socket
 import sys
+import threading
+import unittest
 import requests
 import subprocess
-from typing import Tuple
-
-# Colors for output
-GREEN = "\033[0;32m"
-RED = "\033[0;31m"
-BLUE = "\033[0;34m"
-YELLOW = "\033[1;33m"
-NC = "\033[0m"
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import Callable, List, NamedTuple, Optional, Tuple, Union
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+# Colors for output; left empty when stdout is not a terminal (CI logs, pipes)
+_TTY = sys.stdout.isatty()
+GREEN = "\033[0;32m" if _TTY else ""
+RED = "\033[0;31m" if _TTY else ""
+BLUE = "\033[0;34m" if _TTY else ""
+YELLOW = "\033[1;33m" if _TTY else ""
+NC = "\033[0m" if _TTY else ""
+
+# (connect, read) timeouts; healthy services answer well within these, so a
+# dead endpoint fails the check quickly
+PROXY_TIMEOUT = (2, 3)
+INTERNET_TIMEOUT = (2, 4)
+
+# Shared by all checks so repeated hosts reuse pooled connections instead of
+# redoing the TCP and TLS handshakes; sized for the concurrent test threads
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+
+def _get_status(url: str, timeout: Tuple[float, float]) -> int:
+    """Fetch a URL's status code with HEAD, so no body is downloaded
+
+    Servers that reject HEAD get a plain GET instead; its body is read in
+    full so the connection goes back to the pool rather than being closed.
+    """
+    response = _session.head(url, timeout=timeout)
+    if response.status_code in (405, 501):
+        response = _session.get(url, timeout=timeout)
+    return response.status_code
+
+
+@lru_cache(maxsize=1)
+def _get_proxy_health() -> requests.Response:
+    """Fetch the proxy health endpoint once per run (several checks use it)"""
+    return _session.get("http://proxy:3000/health", timeout=PROXY_TIMEOUT)
 
 
 def print_test(name: str):
@@ -38,13 +81,13 @@ def print_warning(message: str):
     print(f"{YELLOW}⚠️  {message}{NC}")
 
 
-def test_container_to_proxy() -> bool:
+def check_container_to_proxy() -> bool:
     """Test connectivity from agent to proxy container"""
     print_test("Container-to-Container: Agent → Proxy")
 
     try:
         # Test direct connection to proxy health endpoint
-        response = requests.get("http://proxy:3000/health", timeout=5)
+        response = _get_proxy_health()
         if response.status_code == 200:
             print_success("Agent can reach proxy container directly")
             return True
@@ -61,80 +104,164 @@ def test_container_to_proxy() -> bool:
         return False
 
 
-def test_dns_resolution() -> bool:
+# A check result: (passed, print function to report it with, message)
+_CheckResult = Tuple[bool, Callable[[str], None], str]
+
+
+def _report(results: List[_CheckResult]) -> bool:
+    """Print check results in order and return whether all passed"""
+    for _, report, message in results:
+        report(message)
+    return all(ok for ok, _, _ in results)
+
+
+def _resolve(domain: str, description: str) -> _CheckResult:
+    """Resolve one domain without printing, so it can run in a worker thread"""
+    try:
+        ip = socket.gethostbyname(domain)
+        return True, print_success, f"{description} ({domain}) resolves to: {ip}"
+    except socket.gaierror as e:
+        return False, print_error, f"Cannot resolve {domain}: {e}"
+
+
+def check_dns_resolution() -> bool:
     """Test DNS resolution works"""
     print_test("DNS Resolution Test")
 
-    import socket
-
     domains_to_test = [
         ("proxy", "Internal proxy service"),
         ("google.com", "External internet"),
         ("github.com", "GitHub API"),
     ]
 
-    all_resolved = True
-    for domain, description in domains_to_test:
+    # Resolve concurrently; worker threads return messages rather than print,
+    # since only this thread's output is captured for the test
+    with ThreadPoolExecutor(max_workers=len(domains_to_test)) as executor:
+        results = list(executor.map(lambda item: _resolve(*item), domains_to_test))
+
+    return _report(results)
+
+
+def _check_url(url: str, name: str) -> _CheckResult:
+    """Fetch one URL without printing, so it can run in a worker thread"""
+    try:
+        status_code = _get_status(url, timeout=INTERNET_TIMEOUT)
+        if status_code in [200, 301, 302]:
+            return True, print_success, f"Can reach {name}: {url}"
+        return False, print_warning, f"{name} returned status {status_code}"
+    except requests.exceptions.Timeout:
+        return False, print_error, f"Timeout connecting to {name}"
+    except requests.exceptions.ConnectionError as e:
+        return False, print_error, f"Cannot connect to {name}: {e}"
+    except Exception as e:
+        return False, print_error, f"Error connecting to {name}: {e}"
+
+
+def _proxy_endpoints() -> List[Tuple[str, int]]:
+    """Distinct (host, port) pairs of HTTP_PROXY and HTTPS_PROXY
+
+    Parsed the way requests reads them: a missing scheme means http, a
+    missing port the scheme's default; without a host, proxy:3000 is used.
+    """
+    endpoints: List[Tuple[str, int]] = []
+    for var in ("HTTP_PROXY", "HTTPS_PROXY"):
+        value = os.getenv(var, "")
+        parsed = urlsplit(value if "://" in value else f"http://{value}")
         try:
-            ip = socket.gethostbyname(domain)
-            print_success(f"{description} ({domain}) resolves to: {ip}")
-        except socket.gaierror as e:
-            print_error(f"Cannot resolve {domain}: {e}")
-            all_resolved = False
+            port = parsed.port
+        except ValueError:  # non-numeric port
+            port = None
+        if parsed.hostname:
+            endpoint = (
+                parsed.hostname,
+                port or (443 if parsed.scheme == "https" else 80),
+            )
+        else:
+            endpoint = ("proxy", 3000)
+        if endpoint not in endpoints:
+            endpoints.append(endpoint)
+    return endpoints
+
+
+@lru_cache(maxsize=None)
+def _proxy_up(host: str, port: int) -> bool:
+    """Whether a proxy accepts TCP connections (1 s probe, once per run)"""
+    try:
+        socket.create_connection((host, port), timeout=1).close()
+        return True
+    except OSError:
+        return False
+
 
-    return all_resolved
+class Skipped(NamedTuple):
+    """Result of a check that could not run; counted as neither pass nor fail"""
 
+    reason: str
 
-def test_internet_connectivity() -> bool:
+
+# What a check returns: whether it passed, or why it was skipped
+CheckOutcome = Union[bool, Skipped]
+
+
+def _proxy_precondition() -> Optional[CheckOutcome]:
+    """Outcome for a check through the proxy that cannot go ahead, else None"""
+    # Without the proxy env vars the request would bypass the proxy and, in
+    # the isolated container, wait out its timeout, so the check is skipped
+    # (check_proxy_routing reports the cause). A configured proxy that is
+    # down fails the check straight away instead of after the request timeout.
+    if not (os.getenv("HTTP_PROXY") and os.getenv("HTTPS_PROXY")):
+        skipped = Skipped("HTTP_PROXY or HTTPS_PROXY not set")
+        print_warning(f"Skipped: {skipped.reason}")
+        return skipped
+    for host, port in _proxy_endpoints():
+        if not _proxy_up(host, port):
+            print_error(f"Proxy {host}:{port} is not accepting connections")
+            return False
+    return None
+
+
+def check_internet_connectivity() -> CheckOutcome:
     """Test internet connectivity through proxy"""
     print_test("Internet Connectivity Test")
 
+    outcome = _proxy_precondition()
+    if outcome is not None:
+        return outcome
+
     test_urls = [
         ("https://www.google.com", "Google"),
         ("https://api.github.com", "GitHub API"),
         ("https://pypi.org/simple/", "PyPI"),
     ]
 
-    all_passed = True
-    for url, name in test_urls:
-        try:
-            response = requests.get(url, timeout=10)
-            if response.status_code in [200, 301, 302]:
-                print_success(f"Can reach {name}: {url}")
-            else:
-                print_warning(f"{name} returned status {response.status_code}")
-                all_passed = False
-        except requests.exceptions.Timeout:
-            print_error(f"Timeout connecting to {name}")
-            all_passed = False
-        except requests.exceptions.ConnectionError as e:
-            print_error(f"Cannot connect to {name}: {e}")
-            all_passed = False
-        except Exception as e:
-            print_error(f"Error connecting to {name}: {e}")
-            all_passed = False
-
-    return all_passed
-
-
-def test_network_external() -> bool:
+    with ThreadPoolExecutor(max_workers=len(test_urls)) as executor:
+        results = list(executor.map(lambda item: _check_url(*item), test_urls))
+
+    return _report(results)
+
+
+def check_network_external() -> CheckOutcome:
     """Test that network is external (can reach internet via proxy)"""
     print_test("Network External Test (Legacy)")
 
+    outcome = _proxy_precondition()
+    if outcome is not None:
+        return outcome
+
     try:
-        response = requests.get("https://www.google.com", timeout=10)
-        if response.status_code == 200:
+        status_code = _get_status("https://www.google.com", timeout=INTERNET_TIMEOUT)
+        if status_code == 200:
             print_success("Network is external - can reach internet via proxy")
             return True
         else:
-            print_error(f"Unexpected status code: {response.status_code}")
+            print_error(f"Unexpected status code: {status_code}")
             return False
     except Exception as e:
         print_error(f"Cannot reach internet: {e}")
         return False
 
 
-def test_proxy_routing() -> bool:
+def check_proxy_routing() -> bool:
     """Test that requests are routed through proxy"""
     print_test("Proxy Routing Test")
 
@@ -154,7 +281,7 @@ def test_proxy_routing() -> bool:
     print_success(f"Proxy configured: {http_proxy}")
 
     try:
-        response = requests.get("http://proxy:3000/health", timeout=5)
+        response = _get_proxy_health()
         if response.status_code == 200:
             print_success("Proxy is reachable and healthy")
             return True
@@ -166,7 +293,7 @@ def test_proxy_routing() -> bool:
         return False
 
 
-def test_mtls_enabled() -> bool:
+def check_mtls_enabled() -> bool:
     """Test that mTLS is enabled"""
     print_test("mTLS Configuration Test")
 
@@ -204,44 +331,34 @@ def test_mtls_enabled() -> bool:
     return all_exist
 
 
-def test_dummy_credentials() -> bool:
+# (label, env var) pairs that must hold DUMMY placeholders in the agent
+DUMMY_CREDENTIAL_VARS = (
+    ("OpenAI key", "OPENAI_API_KEY"),
+    ("Anthropic key", "ANTHROPIC_API_KEY"),
+    ("GitHub token", "GITHUB_TOKEN"),
+)
+
+
+def check_dummy_credentials() -> bool:
     """Test that agent has dummy credentials only"""
     print_test("Dummy Credentials Test")
 
-    openai_key = os.getenv("OPENAI_API_KEY", "")
-    anthropic_key = os.getenv("ANTHROPIC_API_KEY", "")
-    github_token = os.getenv("GITHUB_TOKEN", "")
-
     all_dummy = True
 
-    if openai_key.startswith("DUMMY"):
-        print_success(f"OpenAI key is dummy: {openai_key}")
-    elif openai_key:
-        print_error(f"OpenAI key might be real: {openai_key[:10]}...")
-        all_dummy = False
-    else:
-        print_warning("OpenAI key not set")
-
-    if anthropic_key.startswith("DUMMY"):
-        print_success(f"Anthropic key is dummy: {anthropic_key}")
-    elif anthropic_key:
-        print_error(f"Anthropic key might be real: {anthropic_key[:10]}...")
-        all_dummy = False
-    else:
-        print_warning("Anthropic key not set")
-
-    if github_token.startswith("DUMMY"):
-        print_success(f"GitHub token is dummy: {github_token}")
-    elif github_token:
-        print_error(f"GitHub token might be real: {github_token[:10]}...")
-        all_dummy = False
-    else:
-        print_warning("GitHub token not set")
+    for label, var_name in DUMMY_CREDENTIAL_VARS:
+        value = os.getenv(var_name, "")
+        if value.startswith("DUMMY"):
+            print_success(f"{label} is dummy: {value}")
+        elif value:
+            print_error(f"{label} might be real: {value[:10]}...")
+            all_dummy = False
+        else:
+            print_warning(f"{label} not set")
 
     return all_dummy
 
 
-def test_env_source_readonly() -> bool:
+def check_env_source_readonly() -> bool:
     """Test that .env.source is read-only"""
     print_test("Source Env File Protection Test")
 
@@ -251,17 +368,16 @@ def test_env_source_readonly() -> bool:
         print_warning(f"Source file not found: {source_path}")
         return True
 
-    try:
-        with open(source_path, "a") as f:
-            f.write("\n# test\n")
+    # access(2) answers for our effective permissions and read-only mounts
+    # without writing to the file
+    if os.access(source_path, os.W_OK):
         print_error("Source file is writable! Should be read-only")
         return False
-    except (IOError, PermissionError):
-        print_success("Source file is read-only (as expected)")
-        return True
+    print_success("Source file is read-only (as expected)")
+    return True
 
 
-def test_credential_injection() -> bool:
+def check_credential_injection() -> bool:
     """Test that proxy injection setup is correct"""
     print_test("Credential Injection Setup Test")
 
@@ -279,7 +395,7 @@ def test_credential_injection() -> bool:
     return True
 
 
-def test_llama_server_localhost() -> bool:
+def check_llama_server_localhost() -> bool:
     """Test llama-server connectivity via localhost (127.0.0.1)"""
     print_test("Llama Server Localhost Connectivity Test")
 
@@ -288,7 +404,7 @@ def test_llama_server_localhost() -> bool:
 
     # Test via host.docker.internal
     try:
-        response = requests.get(
+        response = _session.get(
             f"http://{llama_host}:{llama_port}/v1/models", timeout=3
         )
         if response.status_code == 200:
@@ -304,7 +420,7 @@ def test_llama_server_localhost() -> bool:
 
     # Test via 127.0.0.1 (localhost bypass rule)
     try:
-        response = requests.get(f"http://127.0.0.1:{llama_port}/v1/models", timeout=3)
+        response = _session.get(f"http://127.0.0.1:{llama_port}/v1/models", timeout=3)
         if response.status_code == 200:
             print_success(
                 f"llama-server accessible at 127.0.0.1:{llama_port} (localhost bypass working)"
@@ -325,48 +441,145 @@ def test_llama_server_localhost() -> bool:
         return False
 
 
-def run_all_tests() -> Tuple[int, int]:
-    """Run all tests and return (passed, total)"""
-    tests = [
-        ("DNS Resolution", test_dns_resolution),
-        ("Container-to-Container", test_container_to_proxy),
-        ("Internet Connectivity", test_internet_connectivity),
-        ("Network External", test_network_external),
-        ("Proxy Routing", test_proxy_routing),
-        ("mTLS Enabled", test_mtls_enabled),
-        ("Dummy Credentials", test_dummy_credentials),
-        ("Env Source Read-Only", test_env_source_readonly),
-        ("Credential Injection", test_credential_injection),
-        ("Llama Server Localhost", test_llama_server_localhost),
-    ]
+_thread_output = threading.local()
 
+
+class _PerThreadStdout:
+    """sys.stdout proxy routing each test thread's prints to its own buffer"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        return getattr(_thread_output, "buffer", self._stream).write(text)
+
+    def flush(self) -> None:
+        getattr(_thread_output, "buffer", self._stream).flush()
+
+
+def _run_one(
+    test: Tuple[str, Callable[[], CheckOutcome]],
+) -> Tuple[str, CheckOutcome, Optional[Exception], str]:
+    """Run one test, returning (name, outcome, exception, captured output)"""
+    name, test_func = test
+    _thread_output.buffer = io.StringIO()
+    try:
+        outcome, error = test_func(), None
+    except Exception as e:
+        outcome, error = False, e
+    return name, outcome, error, _thread_output.buffer.getvalue()
+
+
+# Startup checks in report order
+CHECKS: List[Tuple[str, Callable[[], CheckOutcome]]] = [
+    ("DNS Resolution", check_dns_resolution),
+    ("Container-to-Container", check_container_to_proxy),
+    ("Internet Connectivity", check_internet_connectivity),
+    ("Network External", check_network_external),
+    ("Proxy Routing", check_proxy_routing),
+    ("mTLS Enabled", check_mtls_enabled),
+    ("Dummy Credentials", check_dummy_credentials),
+    ("Env Source Read-Only", check_env_source_readonly),
+    ("Credential Injection", check_credential_injection),
+    ("Llama Server Localhost", check_llama_server_localhost),
+]
+
+
+def _run_checks() -> List[Tuple[str, CheckOutcome, Optional[Exception], str]]:
+    """Run all checks concurrently, returning _run_one results in order"""
+    # The checks are independent and mostly wait on network I/O, so run them
+    # concurrently; output is buffered per check and returned in order
+    real_stdout = sys.stdout
+    sys.stdout = _PerThreadStdout(real_stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(CHECKS)) as executor:
+            return list(executor.map(_run_one, CHECKS))
+    finally:
+        sys.stdout = real_stdout
+
+
+def run_all_tests() -> Tuple[int, int, int]:
+    """Run all tests and return (passed, skipped, total)"""
     print(f"\n{BLUE}{'=' * 60}{NC}")
     print(f"{BLUE}SLAPENIR Startup Validation Tests{NC}")
     print(f"{BLUE}{'=' * 60}{NC}")
 
     passed = 0
-    total = len(tests)
-
-    for name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-        except Exception as e:
-            print_error(f"Test '{name}' failed with exception: {e}")
-
-    return passed, total
+    skipped = []
+    total = len(CHECKS)
+
+    for name, outcome, error, output in _run_checks():
+        sys.stdout.write(output)
+        if error is not None:
+            print_error(f"Test '{name}' failed with exception: {error}")
+        elif isinstance(outcome, Skipped):
+            skipped.append(name)
+        elif outcome:
+            passed += 1
+
+    if skipped:
+        print_warning(f"Skipped, not counted as passed: {', '.join(skipped)}")
+
+    return passed, len(skipped), total
+
+
+class TestStartupValidation(unittest.TestCase):
+    """Run the startup checks under pytest/unittest, one subtest per check"""
+
+    def test_startup_checks(self):
+        """Every startup check passes"""
+        with _unit_mode_stubs():
+            results = _run_checks()
+        for name, outcome, error, output in results:
+            with self.subTest(check=name):
+                if error is not None:
+                    raise error
+                if isinstance(outcome, Skipped):
+                    self.skipTest(f"{name}: {outcome.reason}")
+                self.assertTrue(outcome, f"{name} check failed:\n{output}")
+
+
+def _canned_response(*args, **kwargs) -> requests.Response:
+    """Stand-in for _session.get/head in unit mode: an empty 200 response"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b""
+    return response
+
+
+@contextlib.contextmanager
+def _unit_mode_stubs():
+    """Stub network calls while active if SLAPENIR_TEST_MODE=unit"""
+    with contextlib.ExitStack() as stack:
+        # Unit mode runs the checks offline: HTTP calls get a canned 200 and
+        # every name resolves to loopback
+        if os.getenv("SLAPENIR_TEST_MODE") == "unit":
+            for method in ("get", "head"):
+                stack.enter_context(patch.object(_session, method, _canned_response))
+            stack.enter_context(
+                patch.object(socket, "gethostbyname", return_value="127.0.0.1")
+            )
+            stack.enter_context(
+                patch.object(sys.modules[__name__], "_proxy_up", return_value=True)
+            )
+            print_warning("Unit mode: network calls are stubbed")
+        yield
 
 
 def main():
     """Main entry point"""
-    passed, total = run_all_tests()
+    with _unit_mode_stubs():
+        passed, skipped, total = run_all_tests()
 
     print(f"\n{BLUE}{'=' * 60}{NC}")
     if passed == total:
         print(f"{GREEN}✅ All tests passed: {passed}/{total}{NC}")
         sys.exit(0)
     else:
-        print(f"{YELLOW}⚠️  Some tests failed: {passed}/{total} passed{NC}")
+        print(
+            f"{YELLOW}⚠️  Some tests failed: {passed}/{total} passed"
+            f", {skipped} skipped{NC}"
+        )
         sys.exit(1)
 
 